@@ -1,12 +1,25 @@
+import asyncio
+import concurrent.futures
+import functools
 import json
 import html
+import hashlib
+import itertools
+import os
 import pathlib
+from collections import OrderedDict
 from typing import Dict, List
-import base64
-import mimetypes
-import math
 
+import numpy as np
 import panel as pn
+import param
+from panel.custom import JSComponent
+from tornado.web import HTTPError, StaticFileHandler
+
+try:  # orjson is a much faster drop-in for parsing manifests, but optional
+    import orjson
+except ImportError:
+    orjson = None
 
 # Enable Panel
 pn.extension()
@@ -16,125 +29,273 @@ pn.extension()
 ###############################################################################
 # Path to the manifest describing a single conversation.  Update this path or
 # provide a different one when launching Panel, e.g.:
-#   panel serve tts_chat_explorer.py --args my_manifest.json
+#   panel serve explore.py --plugins explore --args my_manifest.json
 DEFAULT_META_MANIFEST = pathlib.Path(__file__).with_name("example_meta_manifest.json")
 
+# URL prefix under which per-turn audio files are streamed (see ROUTES below).
+AUDIO_ROUTE = "/s2s-audio"
+
+# token -> absolute audio path.  Kept in ``pn.state.cache`` so that the copy of
+# this module imported via ``--plugins`` (which serves the route) and the copy
+# executed by ``panel serve`` (which renders the chat) share one registry.
+# It is shared by all sessions, so it is an LRU capped at _AUDIO_REGISTRY_SIZE;
+# every render refreshes the turns it shows.
+_AUDIO_REGISTRY_SIZE = 20_000
+_AUDIO_REGISTRY: "OrderedDict[str, pathlib.Path]" = pn.state.cache.setdefault("s2s_audio_registry", OrderedDict())
+
+# Worker threads that load conversation manifests off the Bokeh IOLoop,
+# shared by all sessions.
+_EXEC = pn.state.as_cached("s2s_executor", concurrent.futures.ThreadPoolExecutor, max_workers=2)
+
+# Keys _load_conversation adds to each turn; hidden from the hover tooltip
+_PRIVATE_TURN_KEYS = ("_abs_audio", "_audio_ok")
+
 ###############################################################################
 # HELPER FUNCTIONS
 ###############################################################################
 
 def _escape(text: str) -> str:
     """HTML-escape *text* for safe insertion into attribute/body."""
+    # html.escape's chained str.replace calls beat a str.maketrans/translate
+    # table by 2-8x on chat-sized strings (translate with a dict table goes
+    # through a per-character lookup), so keep it.
     return html.escape(str(text), quote=True)
 
 
+def _loads(data: bytes):
+    """Parse JSON *data*, with orjson when available.
+
+    orjson rejects NaN/Infinity, which json.dump writes by default, so such
+    documents fall back to the stdlib parser.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def _fmt_time(seconds: float | int) -> str:
     """Return m:ss.xx string for *seconds*."""
-    try:
-        sec = float(seconds)
-    except Exception:
-        return str(seconds)
+    if not isinstance(seconds, (int, float)):
+        try:
+            seconds = float(seconds)
+        except Exception:
+            return str(seconds)
 
-    m = int(sec // 60)
-    s = sec % 60
-    return f"{m}:{s:05.2f}"
+    m, s = divmod(seconds, 60)
+    return f"{int(m)}:{s:05.2f}"
 
 
-def _audio_tag(file_path: str | pathlib.Path) -> str:
-    """Return an <audio> HTML tag with base64-embedded audio if path exists."""
+@functools.lru_cache(maxsize=4096)
+def _audio_token(file_path: str) -> str:
+    """Return the URL token for the absolute audio path *file_path*.
+
+    Only the hash is used (no file suffix), so nothing from the manifest ends up
+    in the URL; _AudioHandler takes the content type from the registered path.
+    """
+    return hashlib.sha1(file_path.encode()).hexdigest()[:16]
+
+
+def _audio_url(file_path: str) -> str:
+    """Return the HTML-escaped AUDIO_ROUTE URL that streams *file_path*."""
+    return _escape(f"{AUDIO_ROUTE}/{_audio_token(file_path)}")
+
+
+def _register_audio(file_path: str) -> None:
+    """Make *file_path* streamable (again), evicting the least recently used paths."""
+    token = _audio_token(file_path)
+    if token in _AUDIO_REGISTRY:
+        _AUDIO_REGISTRY.move_to_end(token)
+        return
+    _AUDIO_REGISTRY[token] = pathlib.Path(file_path)
+    while len(_AUDIO_REGISTRY) > _AUDIO_REGISTRY_SIZE:
+        _AUDIO_REGISTRY.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=4096)
+def _audio_tag(file_path: str) -> str:
+    """Return a lazy <audio> HTML tag; ChatView fills in ``src`` once it scrolls into view.
+
+    The tag is cached, so callers must _register_audio the path on every render.
+    """
 
     if not file_path:
         return ""
 
-    p = pathlib.Path(file_path)
-    if not p.exists():
-        return ""
+    return f"<audio controls class='turn-audio' preload='none' data-src='{_audio_url(file_path)}'></audio>"
 
-    mime, _ = mimetypes.guess_type(str(p))
-    if mime is None:
-        mime = "audio/wav"
 
-    try:
-        data_b64 = base64.b64encode(p.read_bytes()).decode()
-    except Exception:
-        return ""
+class _AudioHandler(StaticFileHandler):
+    """Serve registered audio files (with Range support) by token."""
 
-    return (
-        f"<audio controls class='turn-audio'>"
-        f"<source src='data:{mime};base64,{data_b64}' type='{mime}' />"
-        "</audio>"
-    )
+    @classmethod
+    def get_absolute_path(cls, root: str, path: str) -> str:
+        p = _AUDIO_REGISTRY.get(path)
+        return str(p) if p is not None else ""
+
+    def validate_absolute_path(self, root: str, absolute_path: str) -> str | None:
+        if not absolute_path or not pathlib.Path(absolute_path).is_file():
+            raise HTTPError(404)
+        return absolute_path
 
 
-def _build_message(turn: Dict, user_nick: str, agent_nick: str) -> str:
-    """Return an HTML snippet representing a single chat bubble."""
+# Picked up by `panel serve ... --plugins explore`
+ROUTES = [(AUDIO_ROUTE + r"/(.+)", _AudioHandler, {"path": "/"})]
 
-    is_user = turn.get("speaker", "").upper() == "USER"
-    nick = user_nick if is_user else agent_nick
-    css_class = "user" if is_user else "agent"
 
-    # Build tooltip containing all additional turn fields
-    tooltip_lines = [
+def _turn_meta(turn: Dict) -> str:
+    """Return tooltip text listing all additional fields of *turn*."""
+    return "\n".join(
         f"{k}: {v}" for k, v in turn.items()
-        if k not in ("speaker", "utterance")
-    ]
-    tooltip = _escape("\n".join(tooltip_lines))
-
-    audio_html = _audio_tag(turn.get("audio_filepath", ""))
-
-    return (
-        f"<div class='bubble {css_class}' data-meta=\"{tooltip}\" title=\"{_escape('Details')}\">"
-        f"<span class='nick'>{_escape(nick)}</span><br/>"
-        f"{_escape(turn.get('utterance', ''))}"
-        f"<div class='ts'>{_escape(_fmt_time(turn.get('start_time', 0)))}</div>"
-        f"{audio_html}"
-        "</div>"
+        if k not in ("speaker", "utterance") and k not in _PRIVATE_TURN_KEYS
     )
 
 
-def _chat_html(manifest: Dict) -> str:
-    """Assemble full chat column HTML."""
-    bubbles = [
-        _build_message(t, manifest.get("user_speaker", "User"), manifest.get("agent_speaker", "Agent"))
-        for t in manifest.get("turns", [])
-    ]
+def _chat_html(manifest: Dict, turns: List[Dict] | None = None) -> str:
+    """Assemble chat column HTML for *turns* (defaults to all turns of *manifest*).
+
+    Each bubble carries its position in *turns* as ``data-turn-idx``, which
+    indexes the tooltip list ChatView receives separately.
+    """
+    if turns is None:
+        turns = manifest.get("turns", [])
+
+    # Bubble markup is built inline (no per-turn helper call); everything up to
+    # the turn index (*_open) and from the index to the utterance (*_head) is
+    # per-speaker constant.  *_head starts mid-attribute: it closes the
+    # data-turn-idx value that *_open opened.
+    user_open = "<div class='bubble user' data-turn-idx='"
+    agent_open = "<div class='bubble agent' data-turn-idx='"
+    user_head = f"' title=\"Details\"><span class='nick'>{_escape(manifest.get('user_speaker', 'User'))}</span><br/>"
+    agent_head = f"' title=\"Details\"><span class='nick'>{_escape(manifest.get('agent_speaker', 'Agent'))}</span><br/>"
+
+    bubbles = []
+    for i, t in enumerate(turns):
+        is_user = t.get("speaker", "").upper() == "USER"
+        audio_ok = t.get("_audio_ok")
+        if audio_ok:
+            _register_audio(t["_abs_audio"])
+        bubbles.append(
+            f"{user_open if is_user else agent_open}{i}{user_head if is_user else agent_head}"
+            f"{_escape(t.get('utterance', ''))}"
+            f"<div class='ts'>{_escape(_fmt_time(t.get('start_time', 0)))}</div>"
+            f"{_audio_tag(t['_abs_audio']) if audio_ok else ''}"
+            "</div>"
+        )
     return "<div class='chat'>" + "\n".join(bubbles) + "</div>"
 
 
-def _read_meta_manifest(meta_path: pathlib.Path) -> List[Dict]:
-    """Read meta manifest (JSON-lines)."""
-    entries: List[Dict] = []
-    with meta_path.open() as f:
-        for line in f:
-            line = line.strip()
-            if not line:
+class _MetaManifest:
+    """Column-wise (structure-of-arrays) view of a JSON-lines meta manifest.
+
+    Only the fields needed by the sidebar are kept in memory: ``num_turns``,
+    ``total_duration`` and ``conversation_id`` as arrays, plus the byte span of
+    every line.  Full entries are re-read from disk when a conversation is
+    opened.
+    """
+
+    def __init__(self, meta_path: pathlib.Path):
+        self._path = meta_path
+
+        lines = meta_path.read_bytes().splitlines(keepends=True)
+        ends = np.fromiter(itertools.accumulate(map(len, lines)), dtype=np.int64, count=len(lines))
+        # Pull the three columns out line by line; parsed dicts are dropped
+        # immediately, which keeps the garbage collector out of the way
+        turns: List[int] = []
+        durations: List[float] = []
+        ids: List[str] = []
+        rows: List[int] = []
+        for i, line in enumerate(lines):
+            if line.isspace():
                 continue
             try:
-                entries.append(json.loads(line))
+                e = _loads(line)
             except Exception:
-                continue
-    return entries
+                continue  # skip malformed lines, keep the rest
+            turns.append(e["num_turns"])
+            durations.append(e["total_duration"])
+            ids.append(e["conversation_id"])
+            rows.append(i)
+        del lines
+
+        self.num_turns = np.array(turns, dtype=np.int64)
+        self.total_duration = np.array(durations, dtype=np.float64)
+        self.conversation_id = np.array(ids, dtype=object)
+
+        row_idx = np.array(rows, dtype=np.int64)
+        self._ends = ends[row_idx]
+        self._starts = np.where(row_idx > 0, ends[row_idx - 1], 0)
+        self._row_by_id = {cid: i for i, cid in enumerate(ids)}
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def get(self, conv_id: str) -> Dict | None:
+        """Return the full meta entry for *conv_id*, or None if it can't be read back.
+
+        Each call opens its own file handle, so concurrent lookups never share a
+        file position.  If the manifest was rewritten since it was indexed, the
+        stored span no longer holds *conv_id* and None is returned.
+        """
+        row = self._row_by_id.get(conv_id)
+        if row is None:
+            return None
+        start, end = int(self._starts[row]), int(self._ends[row])
+        try:
+            with self._path.open("rb") as f:
+                f.seek(start)
+                entry = _loads(f.read(end - start))
+        except Exception:
+            return None
+        if not isinstance(entry, dict) or entry.get("conversation_id") != conv_id:
+            return None
+        return entry
+
+
+def _read_meta_manifest(meta_path: pathlib.Path) -> _MetaManifest:
+    """Read meta manifest (JSON-lines)."""
+    return _MetaManifest(meta_path)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_manifest_cached(path_str: str, mtime_ns: int) -> Dict:
+    """Parse conversation manifest; *mtime_ns* keys the cache so edits are picked up.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return _loads(pathlib.Path(path_str).read_bytes())
 
 
 def _load_conversation(entry: Dict, base_dir: pathlib.Path) -> Dict:
     """Load conversation manifest and fix relative paths."""
 
     meta_file = base_dir / entry["metadata_path"]
-    manifest = json.loads(meta_file.read_text())
+    st = meta_file.stat()
+    cached = _parse_manifest_cached(str(meta_file), st.st_mtime_ns)
 
-    # Fix per-turn audio paths
-    manifest_dir = meta_file.parent
-    for turn in manifest.get("turns", []):
+    # Shallow copies are enough: only top-level and per-turn keys are added
+    manifest = dict(cached)
+    manifest["turns"] = [dict(t) for t in cached.get("turns", [])]
+
+    # Resolve per-turn audio paths (string ops only, no realpath walk) into
+    # private keys, and stat each file once so rendering doesn't have to
+    manifest_dir = str(meta_file.parent)
+    for turn in manifest["turns"]:
         fp = turn.get("audio_filepath")
-        if fp and not pathlib.Path(fp).is_absolute():
-            turn["audio_filepath"] = str((manifest_dir / fp).resolve())
+        if fp and not os.path.isabs(fp):
+            fp = os.path.normpath(os.path.join(manifest_dir, fp))
+        turn["_abs_audio"] = fp
+        turn["_audio_ok"] = bool(fp) and os.path.isfile(fp)
 
     # Also fix conversation-level audio path
     audio_fp = entry.get("wav_path")
-    if audio_fp and not pathlib.Path(audio_fp).is_absolute():
-        audio_fp = str((base_dir / audio_fp).resolve())
+    if audio_fp and not os.path.isabs(audio_fp):
+        audio_fp = os.path.normpath(os.path.join(base_dir, audio_fp))
 
     manifest["audio_file"] = audio_fp
+    manifest["_audio_ok"] = bool(audio_fp) and os.path.isfile(audio_fp)
     manifest["conversation_id"] = entry.get("conversation_id", manifest.get("conversation_id"))
     manifest["user_speaker"] = entry.get("user_speaker", manifest.get("user_speaker", "USER"))
     manifest["agent_speaker"] = entry.get("agent_speaker", manifest.get("agent_speaker", "AGENT"))
@@ -142,6 +303,54 @@ def _load_conversation(entry: Dict, base_dir: pathlib.Path) -> Dict:
     return manifest
 
 
+###############################################################################
+# Chat view
+###############################################################################
+
+class ChatView(JSComponent):
+    """HTML pane that attaches turn audio only when a bubble nears the viewport.
+
+    Tooltips are shipped once as a list and copied into a bubble's ``data-meta``
+    attribute on first hover, instead of being duplicated into every bubble.
+    """
+
+    object = param.String(default="", doc="Chat HTML as produced by _chat_html.")
+
+    meta = param.List(default=[], item_type=str, doc="""
+        Tooltip text per bubble, indexed by its data-turn-idx.""")
+
+    _esm = """
+    export function render({ model, el }) {
+      const container = document.createElement("div")
+      const observer = new IntersectionObserver((entries) => {
+        for (const entry of entries) {
+          if (entry.isIntersecting) {
+            const audio = entry.target
+            audio.src = audio.dataset.src
+            observer.unobserve(audio)
+          }
+        }
+      }, { rootMargin: "200px" })
+
+      const update = () => {
+        observer.disconnect()
+        container.innerHTML = model.object
+        container.querySelectorAll(".turn-audio[data-src]").forEach((a) => observer.observe(a))
+      }
+      model.on("object", update)
+      update()
+
+      container.addEventListener("mouseover", (event) => {
+        const bubble = event.target.closest(".bubble[data-turn-idx]")
+        if (bubble && bubble.dataset.meta === undefined) {
+          bubble.dataset.meta = model.meta[bubble.dataset.turnIdx] ?? ""
+        }
+      })
+      return container
+    }
+    """
+
+
 ###############################################################################
 # Duration helper
 ###############################################################################
@@ -157,6 +366,53 @@ def _load_conversation(entry: Dict, base_dir: pathlib.Path) -> Dict:
 #        return 0.0
 
 
+###############################################################################
+# STYLING
+###############################################################################
+
+# Minimal CSS styling.  Appended at import; inside a server session
+# pn.config.raw_css is a per-document copy of the global list, so the guard
+# keeps a session from adding a second copy when the module was already
+# imported globally (e.g. via --plugins).
+_STYLE_CSS = """
+    .chat               {display:flex;flex-direction:column;gap:8px;padding:10px;}
+    .bubble             {border-radius:8px;padding:10px 14px;max-width:75%;position:relative;}
+    .bubble.user        {align-self:flex-start;background:#DCF8C6;}
+    .bubble.agent       {align-self:flex-end;background:#FFFFFF;border:1px solid #ccc;}
+    .bubble:hover       {opacity:0.9;}
+    .nick               {font-weight:600;font-size:0.85em;}
+    .ts                 {font-size:0.70em;color:#555;margin-top:4px;text-align:right;}
+    .turn-audio         {width:200px;margin-top:4px;}
+    .conv-audio         {width:300px;}
+    /* Custom tooltip using data-meta attribute (filled in by ChatView on hover) */
+    .bubble[data-meta]::after {
+        content: attr(data-meta);
+        white-space: pre-line;
+        display: none;
+        position: absolute;
+        left: 0;
+        top: 100%;
+        background: #ffffe1;
+        color: #000;
+        padding: 6px 8px;
+        border: 1px solid #AAA;
+        border-radius: 4px;
+        box-shadow: 0 2px 6px rgba(0,0,0,.15);
+        z-index: 20;
+        max-width: 280px;
+    }
+
+    .bubble[data-meta]:hover::after {
+        display: block;
+    }
+
+    /* Header separator */
+    .conv-header        {border-bottom:1px solid #AAA;padding-bottom:6px;margin-bottom:10px;gap:16px;align-items:center;}
+"""
+if _STYLE_CSS not in pn.config.raw_css:
+    pn.config.raw_css.append(_STYLE_CSS)  # type: ignore[attr-defined]
+
+
 ###############################################################################
 # MAIN APP
 ###############################################################################
@@ -165,24 +421,34 @@ def create_app(meta_manifest_path: pathlib.Path = DEFAULT_META_MANIFEST) -> pn.t
     """Return a Panel Template ready to be served with list of conversations."""
 
     base_dir = meta_manifest_path.parent
-    entries = _read_meta_manifest(meta_manifest_path)
-    if not entries:
+    meta = _read_meta_manifest(meta_manifest_path)
+    if not len(meta):
         raise ValueError("Meta manifest appears empty or unreadable.")
 
     # Pre-compute total_duration for each entry
     #for e in entries:
     #    e["total_duration"] = _compute_total_duration(e, base_dir)
 
+    # Column arrays used for vectorised filtering
+    turns_arr, dur_arr, ids_arr = meta.num_turns, meta.total_duration, meta.conversation_id
+
     # Widgets to be updated -----------------------------------------------
     # Conversation header (title + audio) will live inside the main area
-    chat_pane = pn.pane.HTML(sizing_mode="stretch_both", styles=dict(overflow_y="auto", height="70vh"))
+    chat_pane = ChatView(sizing_mode="stretch_both", styles=dict(overflow_y="auto", height="70vh"))
 
     # Per-conversation widgets (updated on selection)
     conv_title_pane = pn.pane.HTML("<h4>Select a conversation</h4>", sizing_mode="stretch_width")
-    audio_widget = pn.pane.Audio(width=300)  # Empty initially, will set .object later
+    # Whole-dialogue player, streamed from AUDIO_ROUTE (pn.pane.Audio would
+    # base64-inline the file and rejects relative URLs)
+    conv_audio_pane = pn.pane.HTML("", width=300)
+
+    # Long conversations are rendered one window of turns at a time
+    turn_page_size = 50
+    # (Bokeh rejects start == end, so a hidden slider keeps end=2)
+    turn_page_slider = pn.widgets.IntSlider(name="Turns page", start=1, end=2, value=1, visible=False)
 
     # Header row shown above the chat area
-    conv_header_row = pn.Row(conv_title_pane, audio_widget, css_classes=["conv-header"])
+    conv_header_row = pn.Row(conv_title_pane, conv_audio_pane, turn_page_slider, css_classes=["conv-header"])
 
     # Template -------------------------------------------------------------
     template = pn.template.BootstrapTemplate(
@@ -194,19 +460,17 @@ def create_app(meta_manifest_path: pathlib.Path = DEFAULT_META_MANIFEST) -> pn.t
     )
 
     # Filter widgets -------------------------------------------------------
-    min_turns = min(e["num_turns"] for e in entries)
-    max_turns = max(e["num_turns"] for e in entries)
-
-    min_dur = min(e["total_duration"] for e in entries)
-    max_dur = max(e["total_duration"] for e in entries)
+    min_turns, max_turns = int(turns_arr.min()), int(turns_arr.max())
+    # nan-aware: json.dump writes NaN durations, which _loads accepts
+    min_dur, max_dur = int(np.floor(np.nanmin(dur_arr))), int(np.ceil(np.nanmax(dur_arr)))
 
     turns_slider = pn.widgets.IntRangeSlider(
         name="Num Turns", start=min_turns, end=max_turns, value=(min_turns, max_turns)
     )
 
     dur_slider = pn.widgets.RangeSlider(
-        name="Duration (s)", start=math.floor(min_dur), end=math.ceil(max_dur), step=1,
-        value=(math.floor(min_dur), math.ceil(max_dur))
+        name="Duration (s)", start=min_dur, end=max_dur, step=1,
+        value=(min_dur, max_dur)
     )
 
     # Conversation selector with pagination --------------------------------
@@ -224,7 +488,7 @@ def create_app(meta_manifest_path: pathlib.Path = DEFAULT_META_MANIFEST) -> pn.t
             return
 
         page_idx = page_slider.value if isinstance(page_slider.value, int) else 1
-        page_idx = max(1, min(page_idx, math.ceil(len(conv_ids) / page_size)))
+        page_idx = max(1, min(page_idx, -(-len(conv_ids) // page_size)))
         start = (page_idx - 1) * page_size
         end = start + page_size
         conv_select.options = conv_ids[start:end]
@@ -254,15 +518,11 @@ def create_app(meta_manifest_path: pathlib.Path = DEFAULT_META_MANIFEST) -> pn.t
         lo_t, hi_t = turns_slider.value
         lo_d, hi_d = dur_slider.value
 
-        filtered = [
-            e for e in entries
-            if lo_t <= e["num_turns"] <= hi_t and lo_d <= e["total_duration"] <= hi_d
-        ]
-
-        conv_ids = [e["conversation_id"] for e in filtered]
+        mask = (turns_arr >= lo_t) & (turns_arr <= hi_t) & (dur_arr >= lo_d) & (dur_arr <= hi_d)
+        conv_ids = ids_arr[mask].tolist()
 
         # Update pagination slider
-        num_pages = max(1, math.ceil(len(conv_ids)/page_size))
+        num_pages = max(1, -(-len(conv_ids) // page_size))
         page_slider.end = num_pages
         if not isinstance(page_slider.value, int) or page_slider.value > num_pages:
             page_slider.value = 1
@@ -270,27 +530,70 @@ def create_app(meta_manifest_path: pathlib.Path = DEFAULT_META_MANIFEST) -> pn.t
         # Refresh page options
         _update_page_options()
 
-    turns_slider.param.watch(_apply_filters, "value")
-    dur_slider.param.watch(_apply_filters, "value")
+    # Re-filter only when a slider handle is released, not on every drag tick
+    turns_slider.param.watch(_apply_filters, "value_throttled")
+    dur_slider.param.watch(_apply_filters, "value_throttled")
 
     # Watch page changes once (after helper defined)
     page_slider.param.watch(_update_page_options, "value")
 
-    def _update_view(event=None):
-        conv_id = conv_select.value
-        if conv_id is None:
-            return
-        entry = next(it for it in entries if it["conversation_id"] == conv_id)
-        manifest = _load_conversation(entry, base_dir)
+    # Currently displayed conversation, kept so turn paging doesn't reload it
+    manifest: Dict = {}
+
+    def _render_turns(*events):
+        turns = manifest.get("turns", [])
+        start = (turn_page_slider.value - 1) * turn_page_size
+        page_turns = turns[start:start + turn_page_size]
+        chat_pane.param.update(object=_chat_html(manifest, page_turns), meta=[_turn_meta(t) for t in page_turns])
+
+    # Render only once the handle is released, like the filter sliders
+    turn_page_slider.param.watch(_render_turns, "value_throttled")
+
+    # Conversation currently shown (or being loaded); repeat triggers are no-ops
+    rendered_id: str | None = None
 
-        chat_pane.object = _chat_html(manifest)
+    def _load_selected(conv_id: str) -> Dict | None:
+        """Read the meta entry and conversation manifest; runs on _EXEC."""
+        entry = meta.get(conv_id)
+        if entry is None:
+            return None
+        return _load_conversation(entry, base_dir)
 
-        # Update audio (may be slow for large files)
-        audio_fp = manifest.get("audio_file") or ""
-        if audio_fp and pathlib.Path(audio_fp).exists():
-            audio_widget.object = pathlib.Path(audio_fp)
+    async def _update_view(event=None):
+        nonlocal manifest, rendered_id
+        conv_id = conv_select.value
+        if conv_id is None or conv_id == rendered_id:
+            return
+        rendered_id = conv_id
+        try:
+            loaded = await asyncio.get_running_loop().run_in_executor(_EXEC, _load_selected, conv_id)
+        except Exception:
+            rendered_id = None
+            raise
+        if conv_select.value != conv_id:
+            return  # superseded by a newer selection while loading
+        if loaded is None:
+            rendered_id = None
+            return
+        manifest = loaded
+
+        # Back to the first window of turns.  value_throttled is reset too so a
+        # later drag back to the old page still registers as a change; the
+        # watcher skips programmatic updates, so render explicitly.
+        num_turn_pages = max(1, -(-len(manifest.get("turns", [])) // turn_page_size))
+        with param.edit_constant(turn_page_slider), param.parameterized.discard_events(turn_page_slider):
+            turn_page_slider.value_throttled = 1
+        turn_page_slider.param.update(end=max(2, num_turn_pages), value=1, visible=num_turn_pages > 1)
+        _render_turns()
+
+        # Update audio; the browser fetches it from AUDIO_ROUTE only on play
+        if manifest.get("_audio_ok"):
+            _register_audio(manifest["audio_file"])
+            conv_audio_pane.object = (
+                f"<audio controls class='conv-audio' preload='none' src='{_audio_url(manifest['audio_file'])}'></audio>"
+            )
         else:
-            audio_widget.object = ""  # Clear
+            conv_audio_pane.object = ""  # Clear
 
         # Update title immediately for snappier response
         conv_title_pane.object = f"<h4>Conversation: {conv_id}</h4>"
@@ -299,44 +602,7 @@ def create_app(meta_manifest_path: pathlib.Path = DEFAULT_META_MANIFEST) -> pn.t
 
     # Initialize filters and view
     _apply_filters()
-    _update_view()
-
-    # Minimal CSS styling remains below -----------------------------------
-    _style_css = """
-        .chat               {display:flex;flex-direction:column;gap:8px;padding:10px;}
-        .bubble             {border-radius:8px;padding:10px 14px;max-width:75%;position:relative;}
-        .bubble.user        {align-self:flex-start;background:#DCF8C6;}
-        .bubble.agent       {align-self:flex-end;background:#FFFFFF;border:1px solid #ccc;}
-        .bubble:hover       {opacity:0.9;}
-        .nick               {font-weight:600;font-size:0.85em;}
-        .ts                 {font-size:0.70em;color:#555;margin-top:4px;text-align:right;}
-        .turn-audio         {width:200px;margin-top:4px;}
-        /* Custom tooltip using data-meta attribute */
-        .bubble[data-meta]::after {
-            content: attr(data-meta);
-            white-space: pre-line;
-            display: none;
-            position: absolute;
-            left: 0;
-            top: 100%;
-            background: #ffffe1;
-            color: #000;
-            padding: 6px 8px;
-            border: 1px solid #AAA;
-            border-radius: 4px;
-            box-shadow: 0 2px 6px rgba(0,0,0,.15);
-            z-index: 20;
-            max-width: 280px;
-        }
-
-        .bubble[data-meta]:hover::after {
-            display: block;
-        }
-
-        /* Header separator */
-        .conv-header        {border-bottom:1px solid #AAA;padding-bottom:6px;margin-bottom:10px;gap:16px;align-items:center;}
-    """
-    pn.config.raw_css.append(_style_css)  # type: ignore[attr-defined]
+    pn.state.execute(_update_view)
     return template
 
 
@@ -345,7 +611,9 @@ def create_app(meta_manifest_path: pathlib.Path = DEFAULT_META_MANIFEST) -> pn.t
 ###############################################################################
 
 if __name__.startswith("bokeh"):
-    pn.config.raw_css.append("body {background:#F5F5F5;}")  # type: ignore[attr-defined]
+    _BG_CSS = "body {background:#F5F5F5;}"
+    if _BG_CSS not in pn.config.raw_css:
+        pn.config.raw_css.append(_BG_CSS)  # type: ignore[attr-defined]
 
     # Allow passing an alternative manifest via command-line args
     import sys